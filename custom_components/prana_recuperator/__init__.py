@@ -1,6 +1,7 @@
 """The Prana Recuperator integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
@@ -31,13 +32,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     coordinator = PranaCoordinator(hass, api, name)
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
-
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Fetch initial data while the platforms are being set up
+    refresh_result, setup_result = await asyncio.gather(
+        coordinator.async_config_entry_first_refresh(),
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        return_exceptions=True,
+    )
+    if isinstance(refresh_result, BaseException) or isinstance(
+        setup_result, BaseException
+    ):
+        await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        hass.data[DOMAIN].pop(entry.entry_id)
+        if isinstance(refresh_result, BaseException):
+            raise refresh_result
+        raise setup_result
 
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
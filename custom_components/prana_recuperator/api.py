@@ -3,25 +3,81 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 import aiohttp
+import orjson
+from yarl import URL
 
 from .const import (
+    BRIGHTNESS_LEVELS,
     DEFAULT_PORT,
     DEFAULT_TIMEOUT,
+    DNS_CACHE_TTL,
+    FAN_IS_ON_FIELDS,
+    FAN_MAX_SPEED_FIELDS,
+    FAN_SPEED_FIELDS,
     FAN_TYPE_BOUNDED,
     FAN_TYPE_EXTRACT,
     FAN_TYPE_SUPPLY,
+    KEEPALIVE_TIMEOUT,
+    MAX_SPEED,
+    SPEED_STEP,
+    SWITCH_TYPES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-
-@dataclass
+# Device API endpoints
+_ENDPOINTS = ("getState", "setSpeed", "setSpeedIsOn", "setSwitch", "setBrightness")
+
+# Accepted command parameters
+_VALID_SPEEDS = frozenset(range(0, MAX_SPEED + SPEED_STEP, SPEED_STEP))
+_VALID_FAN_TYPES = frozenset((FAN_TYPE_SUPPLY, FAN_TYPE_EXTRACT, FAN_TYPE_BOUNDED))
+_VALID_SWITCHES = SWITCH_TYPES
+_VALID_BRIGHTNESS = frozenset(BRIGHTNESS_LEVELS.values())
+
+# Command bodies are drawn from a small fixed set, so encode them once
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_SPEED_PAYLOADS = {
+    (speed, fan_type): orjson.dumps({"speed": speed, "fanType": fan_type})
+    for speed in _VALID_SPEEDS
+    for fan_type in _VALID_FAN_TYPES
+}
+_SPEED_IS_ON_PAYLOADS = {
+    (value, fan_type): orjson.dumps({"value": value, "fanType": fan_type})
+    for value in (False, True)
+    for fan_type in _VALID_FAN_TYPES
+}
+_SWITCH_PAYLOADS = {
+    (switch_type, value): orjson.dumps({"switchType": switch_type, "value": value})
+    for switch_type in _VALID_SWITCHES
+    for value in (False, True)
+}
+_BRIGHTNESS_PAYLOADS = {
+    brightness: orjson.dumps({"brightness": brightness})
+    for brightness in _VALID_BRIGHTNESS
+}
+
+
+@dataclass(slots=True, eq=True)
 class PranaState:
-    """Represents the state of a Prana device."""
+    """Represents the state of a Prana device.
+
+    Instances compare by value, the coordinator relies on this to skip
+    notifying entities when a poll returns an unchanged state.
+    """
+
+    # Per fan type getters for (speed, max_speed) and is_on
+    _SPEED_GETTERS = {
+        fan_type: attrgetter(field, FAN_MAX_SPEED_FIELDS[fan_type])
+        for fan_type, field in FAN_SPEED_FIELDS.items()
+    }
+    _IS_ON_GETTERS = {
+        fan_type: attrgetter(field) for fan_type, field in FAN_IS_ON_FIELDS.items()
+    }
 
     # Fan states
     extract_speed: int = 0
@@ -58,9 +114,6 @@ class PranaState:
     voc: int | None = None
     air_pressure: float | None = None
 
-    # Raw data
-    raw_data: dict = field(default_factory=dict)
-
     @classmethod
     def from_api_response(cls, data: dict) -> PranaState:
         """Create PranaState from API response."""
@@ -100,32 +153,27 @@ class PranaState:
             co2=data.get("co2"),
             voc=data.get("voc"),
             air_pressure=data.get("air_pressure"),
-            raw_data=data,
         )
 
     def get_speed_percentage(self, fan_type: str) -> int:
         """Get speed as percentage (0-100)."""
-        if fan_type == FAN_TYPE_EXTRACT:
-            speed = self.extract_speed
-            max_speed = self.extract_max_speed
-        elif fan_type == FAN_TYPE_SUPPLY:
-            speed = self.supply_speed
-            max_speed = self.supply_max_speed
-        else:  # bounded
-            speed = self.bounded_speed
-            max_speed = self.bounded_max_speed
+        getter = self._SPEED_GETTERS.get(fan_type) or self._SPEED_GETTERS[FAN_TYPE_BOUNDED]
+        speed, max_speed = getter(self)
 
         if max_speed == 0:
             return 0
         return int((speed / max_speed) * 100)
 
+    def get_speed_level(self, fan_type: str) -> int:
+        """Get speed as a level (0-6)."""
+        getter = self._SPEED_GETTERS.get(fan_type) or self._SPEED_GETTERS[FAN_TYPE_BOUNDED]
+        speed, _ = getter(self)
+        return speed // SPEED_STEP if speed else 0
+
     def is_fan_on(self, fan_type: str) -> bool:
         """Check if a fan type is on."""
-        if fan_type == FAN_TYPE_EXTRACT:
-            return self.extract_is_on
-        elif fan_type == FAN_TYPE_SUPPLY:
-            return self.supply_is_on
-        return self.bounded_is_on
+        getter = self._IS_ON_GETTERS.get(fan_type) or self._IS_ON_GETTERS[FAN_TYPE_BOUNDED]
+        return getter(self)
 
 
 class PranaApiError(Exception):
@@ -153,11 +201,31 @@ class PranaApiClient:
         self._session = session
         self._own_session = session is None
         self._base_url = f"http://{host}:{port}"
+        # Build endpoint URLs once so aiohttp does not re-parse them per request
+        self._urls = {
+            endpoint: URL(f"{self._base_url}/{endpoint}") for endpoint in _ENDPOINTS
+        }
+        # Last state parsed from getState
+        self._last_state: PranaState | None = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self._timeout)
+            # Resolve hostnames with aiodns and cache them instead of running
+            # getaddrinfo in the executor on every request. The device only
+            # copes with one connection, so keep a single socket alive and
+            # reuse it for polls and commands.
+            connector = aiohttp.TCPConnector(
+                resolver=aiohttp.AsyncResolver(),
+                use_dns_cache=True,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                limit_per_host=1,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                force_close=False,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self._timeout
+            )
             self._own_session = True
         return self._session
 
@@ -170,37 +238,49 @@ class PranaApiClient:
         self,
         method: str,
         endpoint: str,
-        data: dict | None = None,
+        payload: bytes | None = None,
     ) -> dict:
         """Make an API request."""
         session = await self._get_session()
-        url = f"{self._base_url}/{endpoint}"
-
-        _LOGGER.debug(
-            "API Request: %s %s data=%s",
-            method,
-            url,
-            data,
-        )
+        url = self._urls[endpoint]
+
+        # Payloads are only formatted when debug logging is enabled
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug(
+                "API Request: %s %s data=%s",
+                method,
+                url,
+                payload,
+            )
+
+        if method == "GET":
+            request = session.get(url)
+        else:  # POST
+            request = session.post(url, data=payload, headers=_JSON_HEADERS)
 
         try:
-            if method == "GET":
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    result = await response.json()
+            async with request as response:
+                response.raise_for_status()
+                # POST endpoints may return empty response, getState may not
+                if method != "GET" and response.content_length == 0:
+                    _LOGGER.debug("API Response: empty (no content)")
+                    return {}
+                try:
+                    result = await response.json(loads=orjson.loads)
+                except aiohttp.ContentTypeError:
+                    if method == "GET":
+                        raise
+                    _LOGGER.debug("API Response: not JSON, ignoring")
+                    return {}
+                if debug:
                     _LOGGER.debug("API Response: %s", result)
-                    return result
-            else:  # POST
-                async with session.post(url, json=data) as response:
-                    response.raise_for_status()
-                    # POST endpoints may return empty response
-                    try:
-                        result = await response.json()
-                        _LOGGER.debug("API Response: %s", result)
-                        return result
-                    except aiohttp.ContentTypeError:
-                        _LOGGER.debug("API Response: empty (no content)")
-                        return {}
+                # An empty JSON body decodes to None
+                if not isinstance(result, dict):
+                    if method == "GET":
+                        raise PranaApiError(f"Unexpected response from {self._host}")
+                    return {}
+                return result
         except aiohttp.ClientConnectorError as err:
             _LOGGER.error("Connection error to %s: %s", self._host, err)
             raise PranaConnectionError(f"Cannot connect to {self._host}: {err}") from err
@@ -217,7 +297,11 @@ class PranaApiClient:
     async def get_state(self) -> PranaState:
         """Get the current device state."""
         data = await self._request("GET", "getState")
-        return PranaState.from_api_response(data)
+        state = PranaState.from_api_response(data)
+        # Idle devices mostly report the same state, hand back the same object
+        if state != self._last_state:
+            self._last_state = state
+        return self._last_state
 
     async def set_speed(self, speed: int, fan_type: str) -> None:
         """Set fan speed.
@@ -226,15 +310,15 @@ class PranaApiClient:
             speed: Speed value (must be multiple of 10, e.g., 10, 20, ..., 60)
             fan_type: Fan type ('supply', 'extract', or 'bounded')
         """
-        if speed % 10 != 0 or speed < 0 or speed > 60:
+        if speed not in _VALID_SPEEDS:
             raise ValueError("Speed must be 0 or a multiple of 10 between 10 and 60")
-        if fan_type not in (FAN_TYPE_SUPPLY, FAN_TYPE_EXTRACT, FAN_TYPE_BOUNDED):
+        if fan_type not in _VALID_FAN_TYPES:
             raise ValueError(f"Invalid fan type: {fan_type}")
 
         await self._request(
             "POST",
             "setSpeed",
-            {"speed": speed, "fanType": fan_type},
+            _SPEED_PAYLOADS[(speed, fan_type)],
         )
 
     async def set_speed_is_on(self, value: bool, fan_type: str) -> None:
@@ -244,13 +328,13 @@ class PranaApiClient:
             value: True to turn on, False to turn off
             fan_type: Fan type ('supply', 'extract', or 'bounded')
         """
-        if fan_type not in (FAN_TYPE_SUPPLY, FAN_TYPE_EXTRACT, FAN_TYPE_BOUNDED):
+        if fan_type not in _VALID_FAN_TYPES:
             raise ValueError(f"Invalid fan type: {fan_type}")
 
         await self._request(
             "POST",
             "setSpeedIsOn",
-            {"value": value, "fanType": fan_type},
+            _SPEED_IS_ON_PAYLOADS[(bool(value), fan_type)],
         )
 
     async def set_switch(self, switch_type: str, value: bool) -> None:
@@ -260,14 +344,13 @@ class PranaApiClient:
             switch_type: Mode type ('bound', 'heater', 'night', 'boost', 'auto', 'auto_plus', 'winter')
             value: True to enable, False to disable
         """
-        valid_switches = ("bound", "heater", "night", "boost", "auto", "auto_plus", "winter")
-        if switch_type not in valid_switches:
+        if switch_type not in _VALID_SWITCHES:
             raise ValueError(f"Invalid switch type: {switch_type}")
 
         await self._request(
             "POST",
             "setSwitch",
-            {"switchType": switch_type, "value": value},
+            _SWITCH_PAYLOADS[(switch_type, bool(value))],
         )
 
     async def set_brightness(self, brightness: int) -> None:
@@ -276,14 +359,13 @@ class PranaApiClient:
         Args:
             brightness: Brightness value (0, 1, 2, 4, 8, 16, or 32)
         """
-        valid_brightness = (0, 1, 2, 4, 8, 16, 32)
-        if brightness not in valid_brightness:
+        if brightness not in _VALID_BRIGHTNESS:
             raise ValueError(f"Invalid brightness value: {brightness}")
 
         await self._request(
             "POST",
             "setBrightness",
-            {"brightness": brightness},
+            _BRIGHTNESS_PAYLOADS[brightness],
         )
 
     async def test_connection(self) -> dict:
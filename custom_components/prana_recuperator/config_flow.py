@@ -101,9 +101,13 @@ class PranaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             discovery_info.properties,
         )
 
-        # Set unique ID based on host
+        # Set unique ID based on host. Repeated announcements of a device that
+        # is configured or already being discovered abort here, before any
+        # request is made to it.
         await self.async_set_unique_id(host)
         self._abort_if_unique_id_configured(updates={CONF_HOST: host})
+        # Entries added manually have no unique ID, match them by host
+        self._async_abort_entries_match({CONF_HOST: host})
 
         self._discovered_host = host
         self._discovered_name = name
@@ -10,6 +10,8 @@ CONF_NAME: Final = "name"
 # API Constants
 DEFAULT_PORT: Final = 80
 DEFAULT_TIMEOUT: Final = 10
+DNS_CACHE_TTL: Final = 300
+KEEPALIVE_TIMEOUT: Final = 75
 
 # Device attributes
 ATTR_EXTRACT_SPEED: Final = "extract_speed"
@@ -18,6 +20,9 @@ ATTR_BOUNDED_SPEED: Final = "bounded_speed"
 ATTR_EXTRACT_IS_ON: Final = "extract_is_on"
 ATTR_SUPPLY_IS_ON: Final = "supply_is_on"
 ATTR_BOUNDED_IS_ON: Final = "bounded_is_on"
+ATTR_EXTRACT_MAX_SPEED: Final = "extract_max_speed"
+ATTR_SUPPLY_MAX_SPEED: Final = "supply_max_speed"
+ATTR_BOUNDED_MAX_SPEED: Final = "bounded_max_speed"
 ATTR_MAX_SPEED: Final = "max_speed"
 ATTR_BOUND: Final = "bound"
 ATTR_HEATER: Final = "heater"
@@ -43,6 +48,23 @@ FAN_TYPE_SUPPLY: Final = "supply"
 FAN_TYPE_EXTRACT: Final = "extract"
 FAN_TYPE_BOUNDED: Final = "bounded"
 
+# State attributes per fan type
+FAN_SPEED_FIELDS: Final = {
+    FAN_TYPE_EXTRACT: ATTR_EXTRACT_SPEED,
+    FAN_TYPE_SUPPLY: ATTR_SUPPLY_SPEED,
+    FAN_TYPE_BOUNDED: ATTR_BOUNDED_SPEED,
+}
+FAN_MAX_SPEED_FIELDS: Final = {
+    FAN_TYPE_EXTRACT: ATTR_EXTRACT_MAX_SPEED,
+    FAN_TYPE_SUPPLY: ATTR_SUPPLY_MAX_SPEED,
+    FAN_TYPE_BOUNDED: ATTR_BOUNDED_MAX_SPEED,
+}
+FAN_IS_ON_FIELDS: Final = {
+    FAN_TYPE_EXTRACT: ATTR_EXTRACT_IS_ON,
+    FAN_TYPE_SUPPLY: ATTR_SUPPLY_IS_ON,
+    FAN_TYPE_BOUNDED: ATTR_BOUNDED_IS_ON,
+}
+
 # Switch types
 SWITCH_TYPE_BOUND: Final = "bound"
 SWITCH_TYPE_HEATER: Final = "heater"
@@ -51,6 +73,17 @@ SWITCH_TYPE_BOOST: Final = "boost"
 SWITCH_TYPE_AUTO: Final = "auto"
 SWITCH_TYPE_AUTO_PLUS: Final = "auto_plus"
 SWITCH_TYPE_WINTER: Final = "winter"
+SWITCH_TYPES: Final = frozenset(
+    (
+        SWITCH_TYPE_BOUND,
+        SWITCH_TYPE_HEATER,
+        SWITCH_TYPE_NIGHT,
+        SWITCH_TYPE_BOOST,
+        SWITCH_TYPE_AUTO,
+        SWITCH_TYPE_AUTO_PLUS,
+        SWITCH_TYPE_WINTER,
+    )
+)
 
 # Brightness levels mapping
 BRIGHTNESS_LEVELS: Final = {
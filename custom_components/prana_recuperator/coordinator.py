@@ -2,28 +2,37 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import replace
 from datetime import timedelta
 import logging
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import PranaApiClient, PranaApiError, PranaConnectionError, PranaState
-from .const import DOMAIN
+from .const import DOMAIN, FAN_IS_ON_FIELDS, FAN_SPEED_FIELDS, SWITCH_TYPES
 
 _LOGGER = logging.getLogger(__name__)
 
 # Polling interval - reduced to 15 seconds for better sync with external app
 SCAN_INTERVAL = timedelta(seconds=15)
 
-# Delay after making a change before refreshing state (let device process)
-POST_COMMAND_DELAY = 0.5
+# Poll faster for a while after a command, slower once the device is idle
+FAST_SCAN_INTERVAL = timedelta(seconds=5)
+FAST_SCAN_DURATION = timedelta(seconds=60)
+IDLE_SCAN_INTERVAL = timedelta(seconds=60)
+IDLE_UNCHANGED_POLLS = 4
 
-# Maximum retries for commands
+# After a change, poll until the device reports it (or give up after 0.5s)
+POST_COMMAND_TIMEOUT = 0.5
+POST_COMMAND_POLL_INTERVAL = 0.1
+
+# Maximum retries for commands, backing off 0.2s, 0.4s, ...
 MAX_RETRIES = 3
-RETRY_DELAY = 1.0
+RETRY_BASE_DELAY = 0.2
 
 
 class PranaCoordinator(DataUpdateCoordinator[PranaState]):
@@ -43,21 +52,85 @@ class PranaCoordinator(DataUpdateCoordinator[PranaState]):
             _LOGGER,
             name=f"{DOMAIN} ({device_name})",
             update_interval=SCAN_INTERVAL,
+            # PranaState compares by value, skip listeners when nothing changed
+            always_update=False,
         )
         self.api = api
         self.device_name = device_name
+        # Shared by all entities of this device
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, api.host)},
+            name=device_name,
+            manufacturer="Prana",
+            model="Recuperator",
+            configuration_url=f"http://{api.host}",
+        )
         # Lock to prevent concurrent modifications
         self._command_lock = asyncio.Lock()
+        # getState request shared by overlapping refreshes
+        self._state_request: asyncio.Task[PranaState] | None = None
+        self._state_request_generation = 0
+        # Bumped whenever commands have been sent to the device
+        self._command_generation = 0
+        # Optimistic changes the device has not confirmed yet
+        self._pending_changes: list[dict[str, Any]] = []
+        # Commands in flight, keyed by command name and arguments
+        self._inflight_commands: dict[tuple[Any, ...], asyncio.Task[None]] = {}
+        # Adaptive polling bookkeeping
+        self._unchanged_polls = 0
+        self._fast_scan_until = 0.0
+
+    async def _async_get_state(self) -> PranaState:
+        """Fetch the device state, joining a request already in flight."""
+        # Only join a request sent after the latest command reached the device
+        if (
+            self._state_request is None
+            or self._state_request_generation != self._command_generation
+        ):
+            self._state_request = self.hass.async_create_task(self.api.get_state())
+            self._state_request.add_done_callback(self._clear_state_request)
+            self._state_request_generation = self._command_generation
+        # Shield so a cancelled caller does not cancel the shared request
+        return await asyncio.shield(self._state_request)
+
+    def _clear_state_request(self, task: asyncio.Task[PranaState]) -> None:
+        """Forget the finished getState request."""
+        if self._state_request is task:
+            self._state_request = None
 
     async def _async_update_data(self) -> PranaState:
         """Fetch data from API."""
+        generation = self._command_generation
         try:
-            return await self.api.get_state()
+            state = await self._async_get_state()
         except PranaConnectionError as err:
+            self._unchanged_polls = 0
+            self.update_interval = SCAN_INTERVAL
             raise UpdateFailed(f"Error communicating with device: {err}") from err
         except PranaApiError as err:
+            self._unchanged_polls = 0
+            self.update_interval = SCAN_INTERVAL
             raise UpdateFailed(f"Error fetching data: {err}") from err
 
+        if generation != self._command_generation and self.data is not None:
+            # Requested before a command went out, the reconcile will follow
+            return self.data
+        state = self._with_pending(state)
+
+        if state == self.data:
+            self._unchanged_polls += 1
+        else:
+            self._unchanged_polls = 0
+
+        if self.hass.loop.time() < self._fast_scan_until:
+            self.update_interval = FAST_SCAN_INTERVAL
+        elif self._unchanged_polls > IDLE_UNCHANGED_POLLS:
+            self.update_interval = IDLE_SCAN_INTERVAL
+        else:
+            self.update_interval = SCAN_INTERVAL
+
+        return state
+
     async def _execute_command_with_retry(
         self,
         command_func,
@@ -80,122 +153,209 @@ class PranaCoordinator(DataUpdateCoordinator[PranaState]):
                     err,
                 )
                 if attempt < MAX_RETRIES - 1:
-                    await asyncio.sleep(RETRY_DELAY)
+                    await asyncio.sleep(RETRY_BASE_DELAY * 2**attempt)
         
         raise last_error
 
-    async def _refresh_after_command(self) -> None:
-        """Refresh data after a command with a small delay."""
-        # Wait for device to process the command
-        await asyncio.sleep(POST_COMMAND_DELAY)
-        # Force a refresh
-        await self.async_refresh()
+    def _patch_state(self, **changes: Any) -> None:
+        """Apply a known change to the cached state and notify entities."""
+        if self.data is None:
+            return
+        # Copy rather than mutate, the API client reuses parsed states
+        self.async_set_updated_data(replace(self.data, **changes))
 
-    async def async_set_speed(self, speed: int, fan_type: str) -> None:
-        """Set fan speed and refresh data."""
-        async with self._command_lock:
-            try:
-                # Get fresh state first to avoid conflicts
-                current_state = await self.api.get_state()
-                _LOGGER.debug(
-                    "Setting %s speed to %d (current: %s)",
-                    fan_type,
-                    speed,
-                    current_state.raw_data,
-                )
-                
-                # Execute the command with retry
-                await self._execute_command_with_retry(
-                    self.api.set_speed, speed, fan_type
-                )
-                
-                # Refresh after command
-                await self._refresh_after_command()
-                
-            except PranaApiError as err:
-                _LOGGER.error("Failed to set speed: %s", err)
-                # Refresh anyway to get current state
-                await self.async_refresh()
-                raise
-
-    async def async_set_fan_on(self, value: bool, fan_type: str) -> None:
-        """Turn fan on/off and refresh data."""
-        async with self._command_lock:
-            try:
-                # Get fresh state first
-                current_state = await self.api.get_state()
-                _LOGGER.debug(
-                    "Setting %s fan to %s (current is_on: %s)",
-                    fan_type,
-                    value,
-                    current_state.is_fan_on(fan_type),
-                )
-                
-                # Execute the command with retry
-                await self._execute_command_with_retry(
-                    self.api.set_speed_is_on, value, fan_type
-                )
-                
-                # Refresh after command
-                await self._refresh_after_command()
-                
-            except PranaApiError as err:
-                _LOGGER.error("Failed to set fan state: %s", err)
-                await self.async_refresh()
-                raise
+    def _with_pending(self, state: PranaState) -> PranaState:
+        """Overlay the changes the device has not confirmed yet."""
+        if not self._pending_changes:
+            return state
+        merged: dict[str, Any] = {}
+        for changes in self._pending_changes:
+            merged.update(changes)
+        return replace(state, **merged)
+
+    def _forget_pending(self, changes: dict[str, Any]) -> None:
+        """Stop overlaying a confirmed, failed or abandoned change."""
+        self._pending_changes = [
+            pending for pending in self._pending_changes if pending is not changes
+        ]
+
+    async def _async_run_once(
+        self,
+        key: tuple[Any, ...],
+        command: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Run a command, or join an identical one that is already in flight."""
+        if (task := self._inflight_commands.get(key)) is None:
+            # Tied to the entry so an unload cancels it
+            task = self.config_entry.async_create_background_task(
+                self.hass, command(), name=f"{self.name} command {key[0]}"
+            )
+            self._inflight_commands[key] = task
+            task.add_done_callback(
+                lambda _task: self._inflight_commands.pop(key, None)
+            )
+        # Shield so a cancelled caller does not cancel the shared command
+        await asyncio.shield(task)
+
+    def _revert_state(
+        self, previous: PranaState | None, changes: dict[str, Any]
+    ) -> None:
+        """Restore the fields of an optimistic change that failed."""
+        if previous is None:
+            return
+        self._patch_state(**{attr: getattr(previous, attr) for attr in changes})
+
+    def _schedule_refresh_after_command(self, changes: dict[str, Any]) -> None:
+        """Reconcile with the device in the background after a command."""
+        # Follow the device closely while the change settles
+        self._unchanged_polls = 0
+        self._fast_scan_until = (
+            self.hass.loop.time() + FAST_SCAN_DURATION.total_seconds()
+        )
+        self.update_interval = FAST_SCAN_INTERVAL
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._refresh_until(changes),
+            name=f"{self.name} reconcile",
+        )
+
+    async def _refresh_until(
+        self,
+        changes: dict[str, Any],
+        timeout: float = POST_COMMAND_TIMEOUT,
+        interval: float = POST_COMMAND_POLL_INTERVAL,
+    ) -> None:
+        """Poll the device until it reports the changes or time runs out."""
+        deadline = self.hass.loop.time() + timeout
+        state: PranaState | None = None
+        try:
+            while True:
+                try:
+                    state = await self._async_get_state()
+                except PranaApiError:
+                    state = None
+                    break
+                if self.hass.loop.time() >= deadline or all(
+                    getattr(state, attr) == value for attr, value in changes.items()
+                ):
+                    break
+                await asyncio.sleep(interval)
+        finally:
+            # Reconciled or given up, report the device as it is from now on
+            self._forget_pending(changes)
+
+        if state is None:
+            # Let the regular refresh record the failure
+            await self.async_refresh()
+            return
+        self.async_set_updated_data(self._with_pending(state))
 
     async def async_set_switch(self, switch_type: str, value: bool) -> None:
         """Set switch state and refresh data."""
-        async with self._command_lock:
-            try:
-                # Get fresh state first
-                current_state = await self.api.get_state()
-                _LOGGER.debug(
-                    "Setting switch %s to %s (current state: %s)",
-                    switch_type,
-                    value,
-                    getattr(current_state, switch_type, None),
-                )
-                
-                # Execute the command with retry
-                await self._execute_command_with_retry(
-                    self.api.set_switch, switch_type, value
-                )
-                
-                # Refresh after command
-                await self._refresh_after_command()
-                
-            except PranaApiError as err:
-                _LOGGER.error("Failed to set switch: %s", err)
-                await self.async_refresh()
-                raise
+        await self._async_run_once(
+            ("set_switch", switch_type, value),
+            lambda: self.async_apply(switches={switch_type: value}),
+        )
 
     async def async_set_brightness(self, brightness: int) -> None:
         """Set brightness and refresh data."""
-        async with self._command_lock:
-            try:
-                # Get fresh state first
-                current_state = await self.api.get_state()
-                _LOGGER.debug(
-                    "Setting brightness to %d (current: %d)",
-                    brightness,
-                    current_state.brightness,
-                )
-                
-                # Execute the command with retry
-                await self._execute_command_with_retry(
-                    self.api.set_brightness, brightness
-                )
-                
-                # Refresh after command
-                await self._refresh_after_command()
-                
-            except PranaApiError as err:
-                _LOGGER.error("Failed to set brightness: %s", err)
-                await self.async_refresh()
-                raise
+        await self._async_run_once(
+            ("set_brightness", brightness),
+            lambda: self.async_apply(brightness=brightness),
+        )
+
+    async def async_set_fan(self, speed: int, on: bool, fan_type: str) -> None:
+        """Set fan speed and on/off state together, sending only what changed."""
+        await self._async_run_once(
+            ("set_fan", speed, on, fan_type),
+            lambda: self._async_set_fan(speed, on, fan_type),
+        )
+
+    async def _async_set_fan(self, speed: int, on: bool, fan_type: str) -> None:
+        """Set fan speed and on/off state, without deduplication."""
+        current = self.data
+        if on and (
+            current is None or getattr(current, FAN_SPEED_FIELDS[fan_type]) != speed
+        ):
+            new_speed: int | None = speed
+        else:
+            new_speed = None
+        if current is not None and current.is_fan_on(fan_type) == on:
+            new_is_on: bool | None = None
+        else:
+            new_is_on = on
+
+        await self.async_apply(fan_type=fan_type, speed=new_speed, is_on=new_is_on)
+
+    async def async_apply(
+        self,
+        *,
+        fan_type: str | None = None,
+        speed: int | None = None,
+        is_on: bool | None = None,
+        switches: dict[str, bool] | None = None,
+        brightness: int | None = None,
+    ) -> None:
+        """Send several changes under one lock and refresh once."""
+        if (speed is not None or is_on is not None) and fan_type not in FAN_SPEED_FIELDS:
+            raise ValueError(f"Invalid fan type: {fan_type}")
+        for switch_type in switches or ():
+            if switch_type not in SWITCH_TYPES:
+                raise ValueError(f"Invalid switch type: {switch_type}")
+
+        commands: list[tuple[Any, ...]] = []
+        changes: dict[str, Any] = {}
+        # Speed goes before is_on so a fan turned on starts at the new speed
+        if speed is not None:
+            commands.append((self.api.set_speed, speed, fan_type))
+            changes[FAN_SPEED_FIELDS[fan_type]] = speed
+        if is_on is not None:
+            commands.append((self.api.set_speed_is_on, is_on, fan_type))
+            changes[FAN_IS_ON_FIELDS[fan_type]] = is_on
+        for switch_type, value in (switches or {}).items():
+            commands.append((self.api.set_switch, switch_type, value))
+            changes[switch_type] = value
+        if brightness is not None:
+            commands.append((self.api.set_brightness, brightness))
+            changes["brightness"] = brightness
+
+        if not commands:
+            return
+
+        _LOGGER.debug("Applying changes: %s", changes)
+
+        # Reflect the changes right away, undo them if a command fails
+        previous = self.data
+        self._patch_state(**changes)
+        # Keep polls that predate the commands from undoing the patch
+        self._pending_changes.append(changes)
+
+        try:
+            async with self._command_lock:
+                try:
+                    # The device handles one request at a time, so send in order
+                    for command_func, *args in commands:
+                        await self._execute_command_with_retry(
+                            command_func, *args
+                        )
+                finally:
+                    # State requests sent before now may predate the change
+                    self._command_generation += 1
+
+                self._schedule_refresh_after_command(changes)
+
+        except PranaApiError as err:
+            self._forget_pending(changes)
+            self._revert_state(previous, changes)
+            _LOGGER.error("Failed to apply changes: %s", err)
+            await self.async_refresh()
+            raise
+        except BaseException:
+            # Invalid parameters or cancellation, don't leave the patch behind
+            self._forget_pending(changes)
+            self._revert_state(previous, changes)
+            raise
 
     async def async_force_refresh(self) -> None:
         """Force an immediate refresh of the data."""
-        async with self._command_lock:
-            await self.async_refresh()
+        await self.async_refresh()
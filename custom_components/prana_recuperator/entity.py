@@ -1,10 +1,11 @@
 """Base entity for Prana Recuperator."""
 from __future__ import annotations
 
-from homeassistant.helpers.device_registry import DeviceInfo
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import PranaCoordinator
 
 
@@ -21,10 +22,19 @@ class PranaEntity(CoordinatorEntity[PranaCoordinator]):
         """Initialize the entity."""
         super().__init__(coordinator)
         self._entry_id = entry_id
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.api.host)},
-            name=coordinator.device_name,
-            manufacturer="Prana",
-            model="Recuperator",
-            configuration_url=f"http://{coordinator.api.host}",
-        )
+        self._attr_device_info = coordinator.device_info
+        # Availability and value last written to the state machine
+        self._last_written: tuple[bool, Any] | None = None
+
+    def _state_snapshot(self) -> Any:
+        """Return the value this entity reports (native_value by default)."""
+        return self.native_value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this entity's value or availability changed."""
+        written = (self.available, self._state_snapshot())
+        if written == self._last_written:
+            return
+        self._last_written = written
+        super()._handle_coordinator_update()
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
+from operator import methodcaller
 from typing import Any, Callable
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription, NumberMode
@@ -25,6 +26,16 @@ from .entity import PranaEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Serialize writes so each one sees the state left by the previous one
+PARALLEL_UPDATES = 1
+
+# Brightness lookups indexed by raw value (0-255) and by level (0-6),
+# unknown values map to the maximum as before
+_BRIGHTNESS_LEVEL_BY_RAW = tuple(BRIGHTNESS_VALUES.get(raw, 6) for raw in range(256))
+_BRIGHTNESS_RAW_BY_LEVEL = tuple(
+    BRIGHTNESS_LEVELS[level] for level in range(len(BRIGHTNESS_LEVELS))
+)
+
 
 @dataclass(frozen=True, kw_only=True)
 class PranaSpeedNumberEntityDescription(NumberEntityDescription):
@@ -45,7 +56,7 @@ SPEED_DESCRIPTIONS: tuple[PranaSpeedNumberEntityDescription, ...] = (
         native_step=1,
         mode=NumberMode.SLIDER,
         fan_type=FAN_TYPE_SUPPLY,
-        value_fn=lambda state: state.supply_speed // SPEED_STEP if state.supply_speed else 0,
+        value_fn=methodcaller("get_speed_level", FAN_TYPE_SUPPLY),
     ),
     PranaSpeedNumberEntityDescription(
         key="extract_speed_control",
@@ -57,7 +68,7 @@ SPEED_DESCRIPTIONS: tuple[PranaSpeedNumberEntityDescription, ...] = (
         native_step=1,
         mode=NumberMode.SLIDER,
         fan_type=FAN_TYPE_EXTRACT,
-        value_fn=lambda state: state.extract_speed // SPEED_STEP if state.extract_speed else 0,
+        value_fn=methodcaller("get_speed_level", FAN_TYPE_EXTRACT),
     ),
     PranaSpeedNumberEntityDescription(
         key="bounded_speed_control",
@@ -69,7 +80,7 @@ SPEED_DESCRIPTIONS: tuple[PranaSpeedNumberEntityDescription, ...] = (
         native_step=1,
         mode=NumberMode.SLIDER,
         fan_type=FAN_TYPE_BOUNDED,
-        value_fn=lambda state: state.bounded_speed // SPEED_STEP if state.bounded_speed else 0,
+        value_fn=methodcaller("get_speed_level", FAN_TYPE_BOUNDED),
     ),
 )
 
@@ -87,8 +98,10 @@ async def async_setup_entry(
     ]
 
     # Add speed control entities
-    for description in SPEED_DESCRIPTIONS:
-        entities.append(PranaSpeedNumber(coordinator, entry.entry_id, description))
+    entities.extend(
+        PranaSpeedNumber(coordinator, entry.entry_id, description)
+        for description in SPEED_DESCRIPTIONS
+    )
 
     async_add_entities(entities)
 
@@ -121,13 +134,22 @@ class PranaBrightnessNumber(PranaEntity, NumberEntity):
 
         raw_brightness = self.coordinator.data.brightness
         # Convert raw value to level (0-6)
+        if (
+            isinstance(raw_brightness, int)
+            and 0 <= raw_brightness < len(_BRIGHTNESS_LEVEL_BY_RAW)
+        ):
+            return _BRIGHTNESS_LEVEL_BY_RAW[raw_brightness]
+        # Floats or a missing value from odd firmware
         return BRIGHTNESS_VALUES.get(raw_brightness, 6)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the brightness level."""
         level = int(value)
         # Convert level (0-6) to raw value
-        raw_brightness = BRIGHTNESS_LEVELS.get(level, 32)
+        if 0 <= level < len(_BRIGHTNESS_RAW_BY_LEVEL):
+            raw_brightness = _BRIGHTNESS_RAW_BY_LEVEL[level]
+        else:
+            raw_brightness = 32
         
         # Skip if value hasn't changed
         if self.coordinator.data and self.coordinator.data.brightness == raw_brightness:
@@ -153,24 +175,25 @@ class PranaSpeedNumber(PranaEntity, NumberEntity):
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.api.host}_{description.key}"
         self._attr_mode = NumberMode.SLIDER
+        self._value_fn = description.value_fn
+        self._fan_type = description.fan_type
 
     @property
     def native_value(self) -> float | None:
         """Return the current speed (0-6)."""
-        if self.coordinator.data is None:
-            return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        data = self.coordinator.data
+        return None if data is None else self._value_fn(data)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the fan speed (0-6)."""
         speed_level = int(value)
-        fan_type = self.entity_description.fan_type
+        fan_type = self._fan_type
         
         # Get current state
         current_speed_level = 0
         current_is_on = False
         if self.coordinator.data:
-            current_speed_level = self.entity_description.value_fn(self.coordinator.data)
+            current_speed_level = self._value_fn(self.coordinator.data)
             current_is_on = self.coordinator.data.is_fan_on(fan_type)
         
         # Skip if value hasn't changed
@@ -182,19 +205,11 @@ class PranaSpeedNumber(PranaEntity, NumberEntity):
             )
             return
         
-        if speed_level == 0:
-            # Turn off the fan (only if it's currently on)
-            if current_is_on:
-                await self.coordinator.async_set_fan_on(False, fan_type)
-            else:
-                _LOGGER.debug("%s fan already off, skipping update", fan_type)
-        else:
-            # Convert level (1-6) to API speed (10-60)
-            api_speed = speed_level * SPEED_STEP
-            
-            # Set speed first
-            await self.coordinator.async_set_speed(api_speed, fan_type)
-            
-            # Then ensure fan is on (if it wasn't already)
-            if not current_is_on:
-                await self.coordinator.async_set_fan_on(True, fan_type)
+        if speed_level == 0 and not current_is_on:
+            _LOGGER.debug("%s fan already off, skipping update", fan_type)
+            return
+
+        # Convert level (1-6) to API speed (10-60), level 0 turns the fan off
+        await self.coordinator.async_set_fan(
+            speed_level * SPEED_STEP, speed_level > 0, fan_type
+        )
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
+from operator import attrgetter, methodcaller
 from typing import Callable
 
 from homeassistant.components.sensor import (
@@ -18,11 +19,11 @@ from homeassistant.const import (
     UnitOfPressure,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .api import PranaState
-from .const import DOMAIN
+from .const import DOMAIN, FAN_TYPE_BOUNDED, FAN_TYPE_EXTRACT, FAN_TYPE_SUPPLY
 from .coordinator import PranaCoordinator
 from .entity import PranaEntity
 
@@ -34,89 +35,77 @@ class PranaSensorEntityDescription(SensorEntityDescription):
     """Describes a Prana sensor entity."""
 
     value_fn: Callable[[PranaState], float | int | None]
-    exists_fn: Callable[[PranaState], bool] = lambda _: True
+    # Optional PranaState field, the sensor is only added when it has data
+    attr: str | None = None
+
+
+def _field_sensor(attr: str, **kwargs) -> PranaSensorEntityDescription:
+    """Describe a sensor that reports a PranaState field as is."""
+    return PranaSensorEntityDescription(
+        key=attr,
+        translation_key=attr,
+        value_fn=attrgetter(attr),
+        attr=attr,
+        **kwargs,
+    )
 
 
 SENSOR_DESCRIPTIONS: tuple[PranaSensorEntityDescription, ...] = (
-    PranaSensorEntityDescription(
-        key="inside_temperature",
-        translation_key="inside_temperature",
+    _field_sensor(
+        "inside_temperature",
         name="Inside Temperature",
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda state: state.inside_temperature,
-        exists_fn=lambda state: state.inside_temperature is not None,
     ),
-    PranaSensorEntityDescription(
-        key="inside_temperature_2",
-        translation_key="inside_temperature_2",
+    _field_sensor(
+        "inside_temperature_2",
         name="Inside Temperature 2",
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda state: state.inside_temperature_2,
-        exists_fn=lambda state: state.inside_temperature_2 is not None,
     ),
-    PranaSensorEntityDescription(
-        key="outside_temperature",
-        translation_key="outside_temperature",
+    _field_sensor(
+        "outside_temperature",
         name="Outside Temperature",
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda state: state.outside_temperature,
-        exists_fn=lambda state: state.outside_temperature is not None,
     ),
-    PranaSensorEntityDescription(
-        key="outside_temperature_2",
-        translation_key="outside_temperature_2",
+    _field_sensor(
+        "outside_temperature_2",
         name="Outside Temperature 2",
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda state: state.outside_temperature_2,
-        exists_fn=lambda state: state.outside_temperature_2 is not None,
     ),
-    PranaSensorEntityDescription(
-        key="humidity",
-        translation_key="humidity",
+    _field_sensor(
+        "humidity",
         name="Humidity",
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda state: state.humidity,
-        exists_fn=lambda state: state.humidity is not None,
     ),
-    PranaSensorEntityDescription(
-        key="co2",
-        translation_key="co2",
+    _field_sensor(
+        "co2",
         name="CO2",
         device_class=SensorDeviceClass.CO2,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-        value_fn=lambda state: state.co2,
-        exists_fn=lambda state: state.co2 is not None,
     ),
-    PranaSensorEntityDescription(
-        key="voc",
-        translation_key="voc",
+    _field_sensor(
+        "voc",
         name="VOC",
         device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS_PARTS,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-        value_fn=lambda state: state.voc,
-        exists_fn=lambda state: state.voc is not None,
     ),
-    PranaSensorEntityDescription(
-        key="air_pressure",
-        translation_key="air_pressure",
+    _field_sensor(
+        "air_pressure",
         name="Air Pressure",
         device_class=SensorDeviceClass.ATMOSPHERIC_PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.HPA,
-        value_fn=lambda state: state.air_pressure,
-        exists_fn=lambda state: state.air_pressure is not None,
     ),
     # Speed sensors
     PranaSensorEntityDescription(
@@ -125,8 +114,7 @@ SENSOR_DESCRIPTIONS: tuple[PranaSensorEntityDescription, ...] = (
         name="Extract Speed",
         icon="mdi:fan",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda state: state.extract_speed // 10 if state.extract_speed else 0,
-        exists_fn=lambda _: True,
+        value_fn=methodcaller("get_speed_level", FAN_TYPE_EXTRACT),
     ),
     PranaSensorEntityDescription(
         key="supply_speed",
@@ -134,8 +122,7 @@ SENSOR_DESCRIPTIONS: tuple[PranaSensorEntityDescription, ...] = (
         name="Supply Speed",
         icon="mdi:fan",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda state: state.supply_speed // 10 if state.supply_speed else 0,
-        exists_fn=lambda _: True,
+        value_fn=methodcaller("get_speed_level", FAN_TYPE_SUPPLY),
     ),
     PranaSensorEntityDescription(
         key="bounded_speed",
@@ -143,8 +130,7 @@ SENSOR_DESCRIPTIONS: tuple[PranaSensorEntityDescription, ...] = (
         name="Bounded Speed",
         icon="mdi:fan",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda state: state.bounded_speed // 10 if state.bounded_speed else 0,
-        exists_fn=lambda _: True,
+        value_fn=methodcaller("get_speed_level", FAN_TYPE_BOUNDED),
     ),
 )
 
@@ -157,13 +143,47 @@ async def async_setup_entry(
     """Set up Prana sensors from config entry."""
     coordinator: PranaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Only add sensors that exist (have data)
-    entities = []
-    for description in SENSOR_DESCRIPTIONS:
-        if coordinator.data and description.exists_fn(coordinator.data):
-            entities.append(PranaSensor(coordinator, entry.entry_id, description))
-
-    async_add_entities(entities)
+    @callback
+    def _async_add_sensors() -> None:
+        """Add the sensors the device reports data for."""
+        # Only add sensors that exist (have data)
+        data = coordinator.data
+        async_add_entities(
+            [
+                PranaSensor(coordinator, entry.entry_id, description)
+                for description in SENSOR_DESCRIPTIONS
+                if description.attr is None
+                or getattr(data, description.attr, None) is not None
+            ]
+        )
+
+    if coordinator.data is not None:
+        _async_add_sensors()
+        return
+
+    # The first refresh runs alongside platform setup, so wait for its data
+    # before deciding which sensors the device has.
+    remove_listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def _async_handle_first_data() -> None:
+        """Add sensors once the first state has been fetched."""
+        nonlocal remove_listener
+        if coordinator.data is None or remove_listener is None:
+            return
+        remove_listener()
+        remove_listener = None
+        _async_add_sensors()
+
+    remove_listener = coordinator.async_add_listener(_async_handle_first_data)
+
+    @callback
+    def _async_remove_listener() -> None:
+        """Stop waiting for the first state."""
+        if remove_listener is not None:
+            remove_listener()
+
+    entry.async_on_unload(_async_remove_listener)
 
 
 class PranaSensor(PranaEntity, SensorEntity):
@@ -181,10 +201,10 @@ class PranaSensor(PranaEntity, SensorEntity):
         super().__init__(coordinator, entry_id)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.api.host}_{description.key}"
+        self._value_fn = description.value_fn
 
     @property
     def native_value(self) -> float | int | None:
         """Return the sensor value."""
-        if self.coordinator.data is None:
-            return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        data = self.coordinator.data
+        return None if data is None else self._value_fn(data)
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
-from typing import Any
+from operator import attrgetter
+from typing import Any, Callable
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
@@ -26,13 +27,16 @@ from .entity import PranaEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Serialize writes so each one sees the state left by the previous one
+PARALLEL_UPDATES = 1
+
 
 @dataclass(frozen=True, kw_only=True)
 class PranaSwitchEntityDescription(SwitchEntityDescription):
     """Describes a Prana switch entity."""
 
     switch_type: str
-    value_fn: callable[[PranaState], bool]
+    value_fn: Callable[[PranaState], bool]
 
 
 SWITCH_DESCRIPTIONS: tuple[PranaSwitchEntityDescription, ...] = (
@@ -42,7 +46,7 @@ SWITCH_DESCRIPTIONS: tuple[PranaSwitchEntityDescription, ...] = (
         name="Bound Mode",
         icon="mdi:link",
         switch_type=SWITCH_TYPE_BOUND,
-        value_fn=lambda state: state.bound,
+        value_fn=attrgetter("bound"),
     ),
     PranaSwitchEntityDescription(
         key="heater",
@@ -50,7 +54,7 @@ SWITCH_DESCRIPTIONS: tuple[PranaSwitchEntityDescription, ...] = (
         name="Heater",
         icon="mdi:radiator",
         switch_type=SWITCH_TYPE_HEATER,
-        value_fn=lambda state: state.heater,
+        value_fn=attrgetter("heater"),
     ),
     PranaSwitchEntityDescription(
         key="winter",
@@ -58,7 +62,7 @@ SWITCH_DESCRIPTIONS: tuple[PranaSwitchEntityDescription, ...] = (
         name="Winter Mode",
         icon="mdi:snowflake",
         switch_type=SWITCH_TYPE_WINTER,
-        value_fn=lambda state: state.winter,
+        value_fn=attrgetter("winter"),
     ),
     PranaSwitchEntityDescription(
         key="auto",
@@ -66,7 +70,7 @@ SWITCH_DESCRIPTIONS: tuple[PranaSwitchEntityDescription, ...] = (
         name="Auto Mode",
         icon="mdi:auto-fix",
         switch_type=SWITCH_TYPE_AUTO,
-        value_fn=lambda state: state.auto,
+        value_fn=attrgetter("auto"),
     ),
     PranaSwitchEntityDescription(
         key="auto_plus",
@@ -74,7 +78,7 @@ SWITCH_DESCRIPTIONS: tuple[PranaSwitchEntityDescription, ...] = (
         name="Auto+ Mode",
         icon="mdi:auto-mode",
         switch_type=SWITCH_TYPE_AUTO_PLUS,
-        value_fn=lambda state: state.auto_plus,
+        value_fn=attrgetter("auto_plus"),
     ),
     PranaSwitchEntityDescription(
         key="night",
@@ -82,7 +86,7 @@ SWITCH_DESCRIPTIONS: tuple[PranaSwitchEntityDescription, ...] = (
         name="Night Mode",
         icon="mdi:weather-night",
         switch_type=SWITCH_TYPE_NIGHT,
-        value_fn=lambda state: state.night,
+        value_fn=attrgetter("night"),
     ),
     PranaSwitchEntityDescription(
         key="boost",
@@ -90,7 +94,7 @@ SWITCH_DESCRIPTIONS: tuple[PranaSwitchEntityDescription, ...] = (
         name="Boost Mode",
         icon="mdi:rocket-launch",
         switch_type=SWITCH_TYPE_BOOST,
-        value_fn=lambda state: state.boost,
+        value_fn=attrgetter("boost"),
     ),
 )
 
@@ -126,38 +130,43 @@ class PranaSwitch(PranaEntity, SwitchEntity):
         super().__init__(coordinator, entry_id)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.api.host}_{description.key}"
+        self._value_fn = description.value_fn
+        self._switch_type = description.switch_type
+
+    def _state_snapshot(self) -> Any:
+        """Return the value this entity reports."""
+        return self.is_on
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        if self.coordinator.data is None:
-            return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        data = self.coordinator.data
+        return None if data is None else self._value_fn(data)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         # Skip if already on
-        if self.coordinator.data and self.entity_description.value_fn(self.coordinator.data):
+        if self.coordinator.data and self._value_fn(self.coordinator.data):
             _LOGGER.debug(
                 "Switch %s already on, skipping update",
-                self.entity_description.switch_type,
+                self._switch_type,
             )
             return
         
         await self.coordinator.async_set_switch(
-            self.entity_description.switch_type, True
+            self._switch_type, True
         )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         # Skip if already off
-        if self.coordinator.data and not self.entity_description.value_fn(self.coordinator.data):
+        if self.coordinator.data and not self._value_fn(self.coordinator.data):
             _LOGGER.debug(
                 "Switch %s already off, skipping update",
-                self.entity_description.switch_type,
+                self._switch_type,
             )
             return
         
         await self.coordinator.async_set_switch(
-            self.entity_description.switch_type, False
+            self._switch_type, False
         )